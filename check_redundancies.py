@@ -3,49 +3,97 @@
 Check for redundancies and issues in cultural filter JSON files.
 """
 import json
-from pathlib import Path
+import os
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Tuple
 
 src_dir = Path("/home/user/talk-like-an-X/src")
-json_files = sorted(src_dir.glob("*_19*.json")) + sorted(src_dir.glob("*_20*.json"))
 
-total_self_mappings = 0
-total_duplicates = 0
 
-for json_file in json_files:
-    with open(json_file, 'r') as f:
-        data = json.load(f)
+def find_json_files(directory: Path) -> List[Path]:
+    """One directory scan for decade-tagged filter files, 1900s before 2000s."""
+    if not directory.is_dir():
+        return []
+    entries = [
+        entry for entry in os.scandir(directory)
+        if entry.name.endswith('.json') and ('_19' in entry.name or '_20' in entry.name)
+    ]
+    entries.sort(key=lambda entry: ('_20' in entry.name, entry.name))
+    return [Path(entry.path) for entry in entries]
+
+
+json_files = find_json_files(src_dir)
+
+
+def check_file(json_file: Path) -> Tuple[int, int, List[str]]:
+    """Check one filter file; returns (self-mapping count, duplicate count, report lines)."""
+    raw = json_file.read_bytes()
+
+    # Both checks ride the parser's own pass over every key/value pair:
+    # the hook sees self-mappings and repeated keys as they are tokenized,
+    # so no separate scan of the raw text is needed
+    self_mappings: List[str] = []
+    duplicate_counts: Counter = Counter()
+
+    def inspect(pairs):
+        seen = {}
+        for key, value in pairs:
+            if key == value:
+                self_mappings.append(key)
+            if key in seen:
+                duplicate_counts[key] += 1
+            seen[key] = value
+        return seen
+
+    data = json.loads(raw, object_pairs_hook=inspect)
 
     if 'substitutions' not in data:
-        continue
+        return 0, 0, []
 
     subs = data['substitutions']
+    report: List[str] = []
 
-    # Check for self-mappings
-    self_mappings = [k for k, v in subs.items() if k == v]
+    # Report self-mappings
     if self_mappings:
-        print(f"\n{json_file.name}:")
-        print(f"  Self-mappings found: {len(self_mappings)}")
+        report.append(f"\n{json_file.name}:")
+        report.append(f"  Self-mappings found: {len(self_mappings)}")
         for sm in self_mappings[:5]:  # Show first 5
-            print(f"    - '{sm}': '{subs[sm]}'")
+            report.append(f"    - '{sm}': '{subs.get(sm, sm)}'")
         if len(self_mappings) > 5:
-            print(f"    ... and {len(self_mappings) - 5} more")
-        total_self_mappings += len(self_mappings)
-
-    # Check for duplicate keys (shouldn't happen but worth checking)
-    with open(json_file, 'r') as f:
-        content = f.read()
-        # Count occurrences of each key pattern
-        for key in subs.keys():
-            count = content.count(f'"{key}":')
-            if count > 1:
-                print(f"\n{json_file.name}:")
-                print(f"  Duplicate key found: '{key}' appears {count} times")
-                total_duplicates += 1
-
-print(f"\n{'='*60}")
-print(f"Total self-mappings found: {total_self_mappings}")
-print(f"Total duplicate keys found: {total_duplicates}")
-
-if total_self_mappings == 0 and total_duplicates == 0:
-    print("✓ All filters are clean - no redundancies found!")
+            report.append(f"    ... and {len(self_mappings) - 5} more")
+
+    # Report duplicate keys (shouldn't happen but worth checking)
+    duplicates = 0
+    for key, extra in duplicate_counts.items():
+        report.append(f"\n{json_file.name}:")
+        report.append(f"  Duplicate key found: '{key}' appears {extra + 1} times")
+        duplicates += 1
+
+    return len(self_mappings), duplicates, report
+
+
+def main() -> None:
+    """Check every filter file in parallel and print an aggregate report."""
+    total_self_mappings = 0
+    total_duplicates = 0
+
+    # Per-file checks are independent, so farm them across cores
+    with ProcessPoolExecutor() as executor:
+        for self_mappings, duplicates, report in executor.map(check_file, json_files):
+            for line in report:
+                print(line)
+            total_self_mappings += self_mappings
+            total_duplicates += duplicates
+
+    print(f"\n{'='*60}")
+    print(f"Total self-mappings found: {total_self_mappings}")
+    print(f"Total duplicate keys found: {total_duplicates}")
+
+    if total_self_mappings == 0 and total_duplicates == 0:
+        print("✓ All filters are clean - no redundancies found!")
+
+
+if __name__ == "__main__":
+    main()
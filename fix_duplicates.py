@@ -4,33 +4,74 @@ Fix duplicate keys in JSON files by removing earlier occurrences.
 Python's json.load() keeps the last occurrence, so we'll do the same.
 """
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import List, Optional
+
+import orjson
 
 src_dir = Path("/home/user/talk-like-an-X/src")
-json_files = sorted(src_dir.glob("*_19*.json")) + sorted(src_dir.glob("*_20*.json"))
 
-for json_file in json_files:
-    # Load the JSON (this will keep only the last occurrence of duplicate keys)
-    with open(json_file, 'r') as f:
-        data = json.load(f)
+
+def find_json_files(directory: Path) -> List[Path]:
+    """One directory scan for decade-tagged filter files, 1900s before 2000s."""
+    if not directory.is_dir():
+        return []
+    entries = [
+        entry for entry in os.scandir(directory)
+        if entry.name.endswith('.json') and ('_19' in entry.name or '_20' in entry.name)
+    ]
+    entries.sort(key=lambda entry: ('_20' in entry.name, entry.name))
+    return [Path(entry.path) for entry in entries]
+
+
+json_files = find_json_files(src_dir)
+
+
+def fix_file(json_file: Path) -> Optional[str]:
+    """Deduplicate one filter file; returns a report line if anything was removed."""
+    # Read once as bytes (json.loads accepts bytes; skips the UTF-8 decode)
+    content = json_file.read_bytes()
+
+    # Record duplicate keys during the parse itself; the hook keeps the
+    # last occurrence, matching json.load's default behaviour
+    duplicate_keys = []
+
+    def keep_last(pairs):
+        seen = {}
+        for key, value in pairs:
+            if key in seen:
+                duplicate_keys.append(key)
+            seen[key] = value
+        return seen
+
+    data = json.loads(content, object_pairs_hook=keep_last)
 
     if 'substitutions' not in data:
-        continue
+        return None
+
+    if not duplicate_keys:
+        return None
+
+    # Write back the cleaned version (stdlib json stays above for the
+    # object_pairs_hook, which orjson does not support)
+    json_file.write_bytes(
+        orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    )
+    return f"{json_file.name}: removed {len(duplicate_keys)} duplicate key(s)"
 
-    # Count original entries by parsing the raw file
-    with open(json_file, 'r') as f:
-        content = f.read()
 
-    original_count = content.count('":')
-    final_count = len(data.get('substitutions', {}))
+def main() -> None:
+    """Deduplicate every filter file in parallel."""
+    # Per-file fixes are independent, so farm them across cores
+    with ProcessPoolExecutor() as executor:
+        for report in executor.map(fix_file, json_files):
+            if report:
+                print(report)
 
-    if original_count != final_count:
-        duplicates_removed = original_count - final_count
-        print(f"{json_file.name}: removed {duplicates_removed} duplicate key(s)")
+    print("\nDuplicate cleanup complete!")
 
-        # Write back the cleaned version
-        with open(json_file, 'w') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.write('\n')
 
-print("\nDuplicate cleanup complete!")
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
-import json
 from pathlib import Path
 
+import orjson
+
 src_dir = Path("/home/user/talk-like-an-X/src")
 
 # Get all JSON files
@@ -10,8 +11,7 @@ json_files = sorted(src_dir.glob("*.json"))
 total_removed = 0
 
 for json_file in json_files:
-    with open(json_file, 'r') as f:
-        data = json.load(f)
+    data = orjson.loads(json_file.read_bytes())
 
     if 'substitutions' not in data:
         continue
@@ -33,8 +33,8 @@ for json_file in json_files:
         total_removed += removed
 
         # Write back with nice formatting
-        with open(json_file, 'w') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.write('\n')
+        json_file.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        )
 
 print(f"\nTotal self-mappings removed: {total_removed}")
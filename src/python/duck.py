@@ -4,10 +4,40 @@ Duck Filter
 
 Replaces all words with variations of "quack" based on word length.
 
+The word pattern and the cased quack forms are built once at import; the
+per-word work is a length bucket, a case test, and a tuple index.
+
 Author: Aaron Wells (2023)
 License: Public domain
 """
 
+import re
+
+_WORD_PATTERN = re.compile(r'[a-zA-Z]+')
+
+_SHORT_FORMS = ('qua', 'Qua', 'QUA')
+_MEDIUM_FORMS = ('quack', 'Quack', 'QUACK')
+_LONG_FORMS = ('quackquack', 'Quackquack', 'QUACKQUACK')
+
+
+def _duck_word(match: re.Match) -> str:
+    """Pick the quack for one word, preserving its capitalization pattern."""
+    word = match.group(0)
+    length = len(word)
+
+    if length <= 3:
+        forms = _SHORT_FORMS
+    elif length >= 10:
+        forms = _LONG_FORMS
+    else:
+        forms = _MEDIUM_FORMS
+
+    if word.isupper():
+        return forms[2]
+    if word[0].isupper():
+        return forms[1]
+    return forms[0]
+
 
 def transform(text: str, **kwargs) -> str:
     """
@@ -24,31 +54,4 @@ def transform(text: str, **kwargs) -> str:
     Returns:
         Duck-ified text with preserved capitalization
     """
-    import re
-
-    def same_cap(original: str, replacement: str) -> str:
-        """Preserve capitalization pattern from original."""
-        if not original:
-            return replacement
-
-        if original.isupper():
-            return replacement.upper()
-        elif original[0].isupper():
-            return replacement.capitalize()
-        else:
-            return replacement.lower()
-
-    def duck_word(match):
-        word = match.group(0)
-        length = len(word)
-
-        if length <= 3:
-            duck = 'qua'
-        elif length >= 10:
-            duck = 'quackquack'
-        else:
-            duck = 'quack'
-
-        return same_cap(word, duck)
-
-    return re.sub(r'[a-zA-Z]+', duck_word, text)
+    return _WORD_PATTERN.sub(_duck_word, text)
@@ -18,22 +18,41 @@ Author: Universal filter builder
 License: GPL
 """
 
+import functools
 import json
+import os
+import pickle
 import sys
 import importlib
 from pathlib import Path
+
+import orjson
 from typing import Dict, Any, List, Callable
 from text_transformer import (
     TextFilter,
     Substitution,
+    HyperscanSubstitution,
+    TrieSubstitution,
     CharacterSubstitution,
     SuffixReplacer,
     PrefixReplacer,
     SentenceAugmenter,
     GlitchTransformer,
-    Transformer
+    Transformer,
+    hyperscan,
+    marisa_trie
 )
 
+# Below this table size the regex alternation is just as fast as Hyperscan
+HYPERSCAN_MIN_TABLE_SIZE = 32
+
+# Below this table size the regex alternation beats the per-character trie walk
+TRIE_MIN_TABLE_SIZE = 200
+
+# Resolved once at import; no need to re-derive per lookup
+SCRIPT_DIR = Path(__file__).parent
+FILTERS_DIR = SCRIPT_DIR.parent / 'filters'
+
 
 class PythonModuleTransformer:
     """Wrapper for Python module-based transformers."""
@@ -79,11 +98,43 @@ class FilterFactory:
         Returns:
             Configured TextFilter ready to use
         """
-        with open(json_path, 'r') as f:
-            config = json.load(f)
+        config = FilterFactory._load_config(Path(json_path))
 
         return FilterFactory.from_dict(config)
 
+    @staticmethod
+    def _load_config(json_path: Path) -> Dict[str, Any]:
+        """
+        Load a filter configuration, caching the parsed dict on disk.
+
+        A pickle of the parsed config is kept next to the JSON file and
+        reused while it is at least as new as the source, so repeated CLI
+        runs skip the JSON parse. The compiled TextFilter itself holds
+        closure-based replacers that pickle cannot serialize, so the cache
+        stores the config rather than the built filter.
+
+        Args:
+            json_path: Path to JSON filter definition
+
+        Returns:
+            Parsed configuration dictionary
+        """
+        cache_path = json_path.with_suffix('.json.pkl')
+        if cache_path.exists() and cache_path.stat().st_mtime >= json_path.stat().st_mtime:
+            try:
+                with open(cache_path, 'rb') as f:
+                    return pickle.load(f)
+            except (pickle.UnpicklingError, EOFError):
+                pass
+
+        config = orjson.loads(json_path.read_bytes())
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+        return config
+
     @staticmethod
     def from_dict(config: Dict[str, Any]) -> TextFilter:
         """
@@ -119,10 +170,23 @@ class FilterFactory:
         filter = TextFilter()
 
         # 1. Substitutions (words and phrases)
-        # This is typically the main vocabulary
+        # This is typically the main vocabulary; large tables get the
+        # Hyperscan scanner when the optional dependency is installed
         if 'substitutions' in config:
-            filter.add(Substitution(
-                config['substitutions'],
+            substitutions = config['substitutions']
+            if hyperscan is not None and len(substitutions) > HYPERSCAN_MIN_TABLE_SIZE:
+                substitution_class = HyperscanSubstitution
+            elif (marisa_trie is not None
+                  and len(substitutions) > TRIE_MIN_TABLE_SIZE
+                  and not any(' ' in key for key in substitutions)):
+                # The trie walk matches keys literally, so phrases split by
+                # irregular whitespace would be missed; only word-only
+                # vocabularies take this backend
+                substitution_class = TrieSubstitution
+            else:
+                substitution_class = Substitution
+            filter.add(substitution_class(
+                substitutions,
                 word_boundary=config.get('word_boundary', True),
                 preserve_case=config.get('preserve_case', True)
             ))
@@ -188,6 +252,36 @@ class FilterFactory:
         return filter
 
 
+def _search_directories() -> List[Path]:
+    """Directories searched for filter files, in priority order."""
+    return [
+        Path.cwd(),      # Current directory
+        FILTERS_DIR,     # src/filters/
+        SCRIPT_DIR,      # Script directory (legacy)
+    ]
+
+
+@functools.lru_cache(maxsize=1)
+def _filter_index() -> Dict[str, Path]:
+    """
+    Index every JSON file under the search directories.
+
+    Built once per process with a single scandir walk; earlier search
+    directories win over later ones, matching the old per-call search
+    order. Repeated lookups then cost one dict hit instead of stat calls.
+    """
+    index: Dict[str, Path] = {}
+    for directory in _search_directories():
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.endswith('.json'):
+                index.setdefault(entry.name.lower(), Path(entry.path))
+    return index
+
+
 def find_filter_file(filter_name: str) -> Path:
     """
     Find a filter JSON file by name.
@@ -210,21 +304,14 @@ def find_filter_file(filter_name: str) -> Path:
     if not filter_name.endswith('.json'):
         filter_name = filter_name + '.json'
 
-    # Search locations
-    search_paths = [
-        Path.cwd() / filter_name,                              # Current directory
-        Path(__file__).parent.parent / 'filters' / filter_name,  # src/filters/
-        Path(__file__).parent / filter_name,                   # Script directory (legacy)
-    ]
-
-    for path in search_paths:
-        if path.exists():
-            return path
+    path = _filter_index().get(filter_name.lower())
+    if path is not None:
+        return path
 
     # Not found - provide helpful error
     raise FileNotFoundError(
         f"Filter '{filter_name}' not found. Searched:\n" +
-        "\n".join(f"  - {p}" for p in search_paths)
+        "\n".join(f"  - {d / filter_name}" for d in _search_directories())
     )
 
 
@@ -9,8 +9,46 @@ Author: Generated from TypeScript filter analysis
 License: GPL (matching original filters)
 """
 
+import functools
+import random
 import re
-from typing import Callable, List, Tuple, Dict, Protocol
+from typing import Callable, Iterator, List, Optional, Tuple, Dict, Protocol
+
+try:
+    import hyperscan
+except ImportError:
+    # Optional accelerator; the pure-regex path below always works
+    hyperscan = None
+
+try:
+    import marisa_trie
+except ImportError:
+    # Optional accelerator; the pure-regex path below always works
+    marisa_trie = None
+
+try:
+    import numpy as np
+except ImportError:
+    # Optional accelerator; the pure-Python paths below always work
+    np = None
+
+try:
+    import regex as _regex
+except ImportError:
+    # Optional engine; stdlib re is the fallback
+    _regex = None
+
+
+def _compile_pattern(pattern: str, flags: int = 0):
+    """
+    Compile through the third-party regex module when installed, else re.
+
+    The regex module is behavior-compatible for the patterns built here and
+    is measurably faster on the large alternations the transformers emit.
+    """
+    if _regex is not None:
+        return _regex.compile(pattern, flags)
+    return re.compile(pattern, flags)
 
 
 # ============================================================================
@@ -50,11 +88,64 @@ def same_cap(original: str, replacement: str) -> str:
 
 def same_cap_replacer(replacement: str) -> Callable[[re.Match], str]:
     """Create a replacer function that preserves capitalization."""
+    lowered, capitalized, uppered = case_forms(replacement)
+
     def replacer(match: re.Match) -> str:
-        return same_cap(match.group(0), replacement)
+        matched = match.group(0)
+        if not matched:
+            return replacement
+        if matched.isupper():
+            return uppered
+        if matched[0].isupper():
+            return capitalized
+        return lowered
     return replacer
 
 
+def case_forms(replacement: str) -> Tuple[str, str, str]:
+    """
+    Precompute the three capitalization forms same_cap can produce.
+
+    Returns (first-lowered, first-capitalized, all-upper), so per-match
+    work reduces to testing the matched text and indexing a tuple.
+    """
+    if not replacement:
+        return (replacement, replacement, replacement)
+    return (
+        replacement[0].lower() + replacement[1:],
+        replacement[0].upper() + replacement[1:],
+        replacement.upper(),
+    )
+
+
+def _resolve_chains(mappings: Dict[str, str]) -> Dict[str, str]:
+    """
+    Follow replacements that are themselves whole mapping keys.
+
+    The per-rule passes the single-alternation scan replaced let later
+    rules transform earlier rules' output, and shipped filters rely on
+    that for chains like "doesn't" -> "don't" -> "dinnae". Resolving
+    value->key chains at compile time (with a cycle guard) keeps whole-key
+    chains working. Keys embedded inside longer replacement values
+    ("hello" -> "hey man" -> "man" stays "man") are deliberately no
+    longer re-transformed, matching the single-pass semantics of the
+    fused character and augmenter stages.
+    """
+    resolved = {}
+    for original, replacement in mappings.items():
+        seen = {original}
+        current = replacement
+        while current in mappings:
+            if current in seen:
+                # Cyclic chain: keep the direct replacement
+                current = replacement
+                break
+            seen.add(current)
+            current = mappings[current]
+        resolved[original] = current
+    return resolved
+
+
 # ============================================================================
 # BASE TRANSFORMER (DRY: Common pattern compilation logic)
 # ============================================================================
@@ -71,7 +162,7 @@ class RegexTransformer:
     def _add_rule(self, pattern: str, replacer: Callable[[re.Match], str],
                   flags: int = 0):
         """Add a compiled regex rule."""
-        self.rules.append((re.compile(pattern, flags), replacer))
+        self.rules.append((_compile_pattern(pattern, flags), replacer))
 
     def transform(self, text: str) -> str:
         """Apply all rules in sequence."""
@@ -106,10 +197,20 @@ class Substitution(RegexTransformer):
 
     def _compile_mappings(self, mappings: Dict[str, str],
                          word_boundary: bool, preserve_case: bool):
-        """Compile all mappings into regex rules (DRY)."""
-        # Sort by length (longest first) to match phrases before words
+        """Compile all mappings into one alternation rule (single-pass scan)."""
+        if not mappings:
+            return
+
+        mappings = _resolve_chains(mappings)
+        self._preserve_case = preserve_case
+        self._replacements: Dict[str, str] = {}
+
+        # Python's re takes the first alternative that matches at a position,
+        # so emitting branches longest-first gives longest-match semantics
+        # (phrases win over the words they contain)
         sorted_items = sorted(mappings.items(), key=lambda x: len(x[0]), reverse=True)
 
+        alternatives = []
         for original, replacement in sorted_items:
             # Build pattern with flexible whitespace for phrases
             if ' ' in original:
@@ -119,18 +220,251 @@ class Substitution(RegexTransformer):
                 # Single word
                 pattern = re.escape(original)
 
-            # Add word boundaries if requested
-            if word_boundary:
-                pattern = r'\b' + pattern + r'\b'
+            alternatives.append(pattern)
+            # Case-colliding keys ('yes'/'Yes') normalize to one entry;
+            # setdefault keeps the first, matching the old per-rule order
+            if preserve_case:
+                self._replacements.setdefault(
+                    self._normalize(original), case_forms(replacement)
+                )
+            else:
+                self._replacements.setdefault(self._normalize(original), replacement)
+
+        # One combined pattern: a single linear scan of the input replaces
+        # N independent scans (one per mapping)
+        combined = '|'.join(alternatives)
+        if word_boundary:
+            combined = r'\b(?:' + combined + r')\b'
+
+        flags = re.IGNORECASE if preserve_case else 0
+        self._add_rule(combined, self._replace_match, flags)
+
+    def _normalize(self, matched: str) -> str:
+        """Collapse whitespace (and case, if preserved) for replacement lookup."""
+        if self._preserve_case:
+            matched = matched.lower()
+        return ' '.join(matched.split())
+
+    def _replace_match(self, match: re.Match) -> str:
+        """Look up the precomputed replacement form for a matched term."""
+        matched = match.group(0)
+        # IGNORECASE folds more variants (e.g. U+017F 'ſ') than lower()
+        # undoes, so a match can still miss the lookup; leave it unchanged
+        entry = self._replacements.get(self._normalize(matched))
+        if entry is None:
+            return matched
+        if not self._preserve_case:
+            return entry
+        lowered, capitalized, uppered = entry
+        if matched.isupper():
+            return uppered
+        if matched[0].isupper():
+            return capitalized
+        return lowered
+
+
+class HyperscanSubstitution:
+    """
+    Drop-in replacement for Substitution backed by Intel Hyperscan.
+
+    Compiles every mapping into one JIT'd multi-pattern database and scans
+    the input once, which beats the regex alternation on large vocabularies.
+    Requires the optional `hyperscan` package; callers should fall back to
+    Substitution when it is unavailable (see FilterFactory).
+    """
+
+    def __init__(self, mappings: Dict[str, str],
+                 word_boundary: bool = True,
+                 preserve_case: bool = True):
+        """
+        Args:
+            mappings: {original: replacement} dictionary
+            word_boundary: Match complete words only
+            preserve_case: Maintain original capitalization
+        """
+        if hyperscan is None:
+            raise ImportError("HyperscanSubstitution requires the 'hyperscan' package")
+
+        mappings = _resolve_chains(mappings)
+        self._preserve_case = preserve_case
+        self._replacements: Dict[str, Tuple[str, str, str]] = {}
 
-            # Create replacer function
-            flags = re.IGNORECASE if preserve_case else 0
+        expressions = []
+        for original, replacement in mappings.items():
+            # Flexible whitespace for phrases, matching the regex backend
+            if ' ' in original:
+                pattern = rb'\s+'.join(
+                    re.escape(word).encode() for word in original.split()
+                )
+            else:
+                pattern = re.escape(original).encode()
+            if word_boundary:
+                pattern = rb'\b' + pattern + rb'\b'
+            expressions.append(pattern)
             if preserve_case:
-                replacer = same_cap_replacer(replacement)
+                self._replacements.setdefault(
+                    self._normalize(original), case_forms(replacement)
+                )
+            else:
+                self._replacements.setdefault(self._normalize(original), replacement)
+
+        flags = hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8
+        if preserve_case:
+            flags |= hyperscan.HS_FLAG_CASELESS
+
+        self._db = hyperscan.Database()
+        self._db.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            flags=[flags] * len(expressions),
+        )
+
+    def _normalize(self, matched: str) -> str:
+        """Collapse whitespace (and case, if preserved) for replacement lookup."""
+        if self._preserve_case:
+            matched = matched.lower()
+        return ' '.join(matched.split())
+
+    def transform(self, text: str) -> str:
+        """Scan the input once and splice in all replacements."""
+        data = text.encode('utf-8')
+        matches: List[Tuple[int, int]] = []
+
+        def on_match(pattern_id: int, start: int, end: int,
+                     flags: int, context=None) -> None:
+            matches.append((start, end))
+
+        self._db.scan(data, match_event_handler=on_match)
+        if not matches:
+            return text
+
+        # Resolve overlapping matches leftmost-first, longest-first, matching
+        # the alternation semantics of the regex path
+        matches.sort(key=lambda span: (span[0], span[0] - span[1]))
+
+        result = []
+        cursor = 0
+        for start, end in matches:
+            if start < cursor:
+                continue
+            original = data[start:end].decode('utf-8')
+            # CASELESS folds more variants (e.g. U+017F 'ſ') than lower()
+            # undoes, so a match can still miss the lookup; leave it unchanged
+            entry = self._replacements.get(self._normalize(original))
+            result.append(data[cursor:start].decode('utf-8'))
+            if entry is None:
+                result.append(original)
+            elif self._preserve_case:
+                lowered, capitalized, uppered = entry
+                if original.isupper():
+                    result.append(uppered)
+                elif original[0].isupper():
+                    result.append(capitalized)
+                else:
+                    result.append(lowered)
+            else:
+                result.append(entry)
+            cursor = end
+        result.append(data[cursor:].decode('utf-8'))
+        return ''.join(result)
+
+
+class TrieSubstitution:
+    """
+    Drop-in replacement for Substitution backed by a marisa-trie DAWG.
+
+    Walks the input once, taking the longest key match at each position,
+    so transform time is linear in the input and independent of how many
+    keys the table holds. Keys are matched literally, so unlike
+    Substitution, phrase keys do not match across irregular whitespace;
+    FilterFactory only selects this backend for word-only vocabularies.
+    Requires the optional `marisa-trie` package; callers should fall
+    back to Substitution when it is unavailable (see FilterFactory).
+    """
+
+    def __init__(self, mappings: Dict[str, str],
+                 word_boundary: bool = True,
+                 preserve_case: bool = True):
+        """
+        Args:
+            mappings: {original: replacement} dictionary
+            word_boundary: Match complete words only
+            preserve_case: Maintain original capitalization
+        """
+        if marisa_trie is None:
+            raise ImportError("TrieSubstitution requires the 'marisa-trie' package")
+
+        mappings = _resolve_chains(mappings)
+        self._word_boundary = word_boundary
+        self._preserve_case = preserve_case
+        self._replacements: Dict = {}
+        for original, replacement in mappings.items():
+            self._replacements.setdefault(
+                self._normalize(original),
+                case_forms(replacement) if preserve_case else replacement,
+            )
+        self._trie = marisa_trie.Trie(list(self._replacements.keys()))
+        self._max_key_length = max(map(len, self._replacements), default=0)
+
+    def _normalize(self, matched: str) -> str:
+        """Collapse whitespace (and case, if preserved) for trie lookup."""
+        if self._preserve_case:
+            matched = matched.lower()
+        return ' '.join(matched.split())
+
+    def transform(self, text: str) -> str:
+        """Walk the input once, splicing in the longest match at each position."""
+        if self._preserve_case:
+            haystack = text.lower()
+            if len(haystack) != len(text):
+                # A few codepoints lower to several chars ('İ'); keep those
+                # as-is so haystack offsets stay aligned with text
+                haystack = ''.join(
+                    char.lower() if len(char.lower()) == 1 else char
+                    for char in text
+                )
+        else:
+            haystack = text
+        result = []
+        position = 0
+        length = len(text)
+
+        while position < length:
+            matched_key = None
+            at_word_start = (position == 0 or not text[position - 1].isalnum())
+            if not self._word_boundary or at_word_start:
+                # Keys can be at most _max_key_length chars, so a bounded
+                # window keeps the walk linear in the input
+                window = haystack[position:position + self._max_key_length]
+                for candidate in sorted(self._trie.prefixes(window),
+                                        key=len, reverse=True):
+                    end = position + len(candidate)
+                    if not self._word_boundary or end == length or not text[end].isalnum():
+                        matched_key = candidate
+                        break
+
+            if matched_key is None:
+                result.append(text[position])
+                position += 1
+                continue
+
+            original = text[position:position + len(matched_key)]
+            entry = self._replacements.get(matched_key)
+            if entry is None:
+                result.append(original)
+            elif self._preserve_case:
+                lowered, capitalized, uppered = entry
+                if original.isupper():
+                    result.append(uppered)
+                elif original[0].isupper():
+                    result.append(capitalized)
+                else:
+                    result.append(lowered)
             else:
-                replacer = lambda m, r=replacement: r
+                result.append(entry)
+            position += len(matched_key)
 
-            self._add_rule(pattern, replacer, flags)
+        return ''.join(result)
 
 
 # ============================================================================
@@ -151,27 +485,97 @@ class CharacterSubstitution(RegexTransformer):
             preserve_case: Maintain original capitalization
         """
         super().__init__()
-        # Sort by length (longest first) to match pairs before singles
+        self._table: Optional[Dict[int, str]] = None
+        if not mappings:
+            return
+
+        self._preserve_case = preserve_case
+        self._replacements: Dict[str, str] = {}
+
+        # All-single-char tables go through str.translate — a C-level sweep
+        # with no regex machinery at all. Keys whose case forms are not
+        # single chars ('ß'.upper() == 'SS') cannot live in an ord-keyed
+        # table and take the alternation path below
+        if all(len(original) == 1
+               and (not preserve_case
+                    or (len(original.lower()) == 1 and len(original.upper()) == 1))
+               for original in mappings):
+            self._build_translation_table(mappings, preserve_case)
+            return
+
+        # Python's re takes the first alternative that matches at a position,
+        # so emitting branches longest-first gives longest-match semantics
+        # (pairs win over the singles they contain)
         sorted_items = sorted(mappings.items(), key=lambda x: len(x[0]), reverse=True)
 
+        alternatives = []
         for original, replacement in sorted_items:
-            pattern = re.escape(original)
-            flags = re.IGNORECASE if preserve_case else 0
-
+            alternatives.append(re.escape(original))
             if preserve_case:
-                replacer = same_cap_replacer(replacement)
+                self._replacements.setdefault(original.lower(), case_forms(replacement))
             else:
-                replacer = lambda m, r=replacement: r
+                self._replacements.setdefault(original, replacement)
+
+        # One combined pattern: a single linear scan of the input replaces
+        # N independent scans (one per mapping)
+        flags = re.IGNORECASE if preserve_case else 0
+        self._add_rule('|'.join(alternatives), self._replace_match, flags)
+
+    def _build_translation_table(self, mappings: Dict[str, str],
+                                 preserve_case: bool):
+        """Flatten single-char rules into a str.translate table."""
+        self._table = {}
+        for original, replacement in mappings.items():
+            if preserve_case:
+                lowered, _, uppered = case_forms(replacement)
+                self._table.setdefault(ord(original.lower()), lowered)
+                if original.upper() != original.lower():
+                    self._table.setdefault(ord(original.upper()), uppered)
+            else:
+                self._table.setdefault(ord(original), replacement)
 
-            self._add_rule(pattern, replacer, flags)
+    def transform(self, text: str) -> str:
+        """Apply the rules in a single sweep."""
+        if self._table is not None:
+            return text.translate(self._table)
+        return super().transform(text)
+
+    def _replace_match(self, match: re.Match) -> str:
+        """Look up the precomputed replacement form for a matched sequence."""
+        matched = match.group(0)
+        if not self._preserve_case:
+            return self._replacements.get(matched, matched)
+        # IGNORECASE folds more variants (e.g. U+017F 'ſ') than lower()
+        # undoes, so a match can still miss the lookup; leave it unchanged
+        entry = self._replacements.get(matched.lower())
+        if entry is None:
+            return matched
+        lowered, capitalized, uppered = entry
+        if matched.isupper():
+            return uppered
+        if matched[0].isupper():
+            return capitalized
+        return lowered
 
 
 # ============================================================================
 # PATTERN 4: SUFFIX/PREFIX TRANSFORMATIONS
 # ============================================================================
 
-class SuffixReplacer(RegexTransformer):
-    """Replace word suffixes (e.g., -ing -> -in', -ly -> -wise)."""
+_WORD_RUN = _compile_pattern(r"[a-zA-Z']+")
+
+
+class SuffixReplacer:
+    """
+    Replace word suffixes (e.g., -ing -> -in', -ly -> -wise).
+
+    Rules live in a trie keyed on the reversed suffix; one scan over the
+    word runs of the text walks each word end once and applies the longest
+    matching rule, instead of one full regex pass per rule.
+    """
+
+    def __init__(self):
+        self._trie: Dict = {}
 
     def add_rule(self, suffix: str, replacement: str, min_stem: int = 2):
         """
@@ -182,9 +586,46 @@ class SuffixReplacer(RegexTransformer):
             replacement: What to replace it with (e.g., "in'")
             min_stem: Minimum stem length before suffix
         """
-        pattern = rf'([a-zA-Z]{{{min_stem},}})' + re.escape(suffix) + r'\b'
-        replacer = lambda m, r=replacement: m.group(1) + r
-        self._add_rule(pattern, replacer, re.IGNORECASE)
+        node = self._trie
+        for char in reversed(suffix.lower()):
+            node = node.setdefault(char, {})
+        node['$'] = (len(suffix), replacement, min_stem)
+
+    def _replace_word(self, match: re.Match) -> str:
+        """Walk the reversed-suffix trie from the end of one word."""
+        run = match.group(0)
+        # Interior apostrophes belong to contractions ("n't", "'re");
+        # apostrophes at the run edges are quote marks, not word characters
+        unquoted = run.lstrip("'")
+        leading = len(run) - len(unquoted)
+        word = unquoted.rstrip("'")
+        trailing = len(unquoted) - len(word)
+        if not word:
+            return run
+        best = None
+
+        node = self._trie
+        for char in reversed(word.lower()):
+            node = node.get(char)
+            if node is None:
+                break
+            terminal = node.get('$')
+            if terminal is not None:
+                suffix_length, replacement, min_stem = terminal
+                if len(word) - suffix_length >= min_stem:
+                    best = (suffix_length, replacement)
+
+        if best is None:
+            return run
+        suffix_length, replacement = best
+        return ("'" * leading + word[:-suffix_length] + replacement
+                + "'" * trailing)
+
+    def transform(self, text: str) -> str:
+        """Apply all suffix rules in one scan of the text."""
+        if not self._trie:
+            return text
+        return _WORD_RUN.sub(self._replace_word, text)
 
 
 class PrefixReplacer(RegexTransformer):
@@ -216,6 +657,8 @@ class SentenceAugmenter:
     def __init__(self):
         self.rules: List[Tuple[str, List[str], int]] = []
         self._counters: Dict[str, int] = {}
+        self._rules_by_punct: Dict[str, Tuple[List[str], int]] = {}
+        self._alternation: Optional[re.Pattern] = None
 
     def add_rule(self, punctuation: str, additions: List[str], frequency: int = 1):
         """
@@ -227,51 +670,70 @@ class SentenceAugmenter:
             frequency: 1=always, 2=every other, 3=every third, etc.
         """
         self.rules.append((punctuation, additions, frequency))
+        self._rules_by_punct[punctuation] = (additions, frequency)
+        self._alternation = None
         if frequency > 1:
             self._counters[punctuation] = 0
 
     def transform(self, text: str) -> str:
-        """Apply all augmentation rules."""
-        for punct, additions, freq in self.rules:
+        """Apply all augmentation rules in one scan of the text."""
+        if not self.rules:
+            return text
+
+        # One alternation over every punctuation mark replaces a full
+        # split+join of the text per rule
+        if self._alternation is None:
+            self._alternation = _compile_pattern(
+                '|'.join(re.escape(punct) for punct, _, _ in self.rules)
+            )
+
+        occurrences: Dict[str, int] = {}
+        result = []
+        previous_end = 0
+
+        for match in self._alternation.finditer(text):
+            punct = match.group(0)
+            additions, freq = self._rules_by_punct[punct]
+            result.append(text[previous_end:match.end()])
+            previous_end = match.end()
+
             if freq == 1:
-                # Always add (cycle through additions)
-                parts = text.split(punct)
-                result = []
-                for i, part in enumerate(parts[:-1]):
-                    result.append(part + punct + additions[i % len(additions)])
-                result.append(parts[-1])
-                text = ''.join(result)
+                # Always add (cycle through additions per call)
+                index = occurrences.get(punct, 0)
+                occurrences[punct] = index + 1
+                result.append(additions[index % len(additions)])
             else:
-                # Add every Nth occurrence
-                parts = text.split(punct)
-                result = []
+                # Add every Nth occurrence (counter persists across calls)
                 counter = self._counters.get(punct, 0)
+                if counter % freq == 0:
+                    result.append(additions[counter % len(additions)])
+                self._counters[punct] = counter + 1
 
-                for i, part in enumerate(parts[:-1]):
-                    result.append(part + punct)
-                    if counter % freq == 0:
-                        result.append(additions[counter % len(additions)])
-                    counter += 1
-
-                result.append(parts[-1])
-                text = ''.join(result)
-                self._counters[punct] = counter
-
-        return text
+        result.append(text[previous_end:])
+        return ''.join(result)
 
 
 # ============================================================================
 # PATTERN 10: CHARACTER TRANSLATION
 # ============================================================================
 
+@functools.lru_cache(maxsize=128)
+def _translation_table(from_chars: str, to_chars: str) -> Dict[int, int]:
+    """Build (and cache) the str.translate table for one alphabet pair."""
+    return str.maketrans(from_chars, to_chars)
+
+
 def character_translation(text: str, from_chars: str, to_chars: str) -> str:
     """
     Character-by-character translation (like Perl's tr///).
 
+    The translation table is cached per (from_chars, to_chars) pair, so
+    repeated calls with a fixed alphabet skip the maketrans dict build.
+
     Example:
         character_translation("hello", "helo", "w3l0") -> "w3ll0"
     """
-    return text.translate(str.maketrans(from_chars, to_chars))
+    return text.translate(_translation_table(from_chars, to_chars))
 
 
 # ============================================================================
@@ -298,18 +760,34 @@ class GlitchTransformer:
         '◒', '◓', '◔', '◕', '◖', '◗', '◘', '◙', '◚', '◛',
     ]
 
+    if np is not None:
+        # Built once at class-definition time; shared by every instance
+        _GLITCH_CODEPOINTS = np.array(
+            [ord(char) for char in GLITCH_CHARS], dtype=np.uint32
+        )
+        _ASCII_ALNUM = np.array(
+            [chr(code).isalnum() for code in range(128)], dtype=bool
+        )
+
     def __init__(self, percentage: int = 100, seed: int = 42):
         """
         Args:
             percentage: Percentage of letters to glitch (0-100)
             seed: Random seed for reproducible results
+
+        With numpy installed, random draws are batched per call instead of
+        made per character; seeded output is reproducible per path, not
+        across the two paths.
         """
         self.percentage = percentage
-        import random
         self.random = random.Random(seed)
+        if np is not None:
+            self._rng = np.random.default_rng(seed)
 
     def transform(self, text: str) -> str:
         """Apply glitch effect to text."""
+        if np is not None:
+            return self._transform_vectorized(text)
         result = []
         for char in text:
             # Only glitch letters and numbers
@@ -319,11 +797,99 @@ class GlitchTransformer:
                 result.append(char)
         return ''.join(result)
 
+    def _transform_vectorized(self, text: str) -> str:
+        """Batch all random draws and apply the glitch through a boolean mask."""
+        codepoints = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).copy()
+        if codepoints.size == 0:
+            return text
+
+        # Only glitch letters and numbers: table lookup for ASCII, with a
+        # per-character fallback for the (rare) non-ASCII codepoints
+        alnum = np.where(
+            codepoints < 128, self._ASCII_ALNUM[np.minimum(codepoints, 127)], False
+        )
+        for index in np.nonzero(codepoints >= 128)[0]:
+            alnum[index] = chr(int(codepoints[index])).isalnum()
+
+        probabilities = self._rng.integers(1, 101, size=codepoints.size)
+        picks = self._rng.integers(0, len(self.GLITCH_CHARS), size=codepoints.size)
+
+        glitch_mask = alnum & (probabilities <= self.percentage)
+        codepoints[glitch_mask] = self._GLITCH_CODEPOINTS[picks[glitch_mask]]
+        return codepoints.tobytes().decode('utf-32-le')
+
 
 # ============================================================================
 # MAIN FILTER ENGINE
 # ============================================================================
 
+class _FusedRegexStage:
+    """
+    One alternation pass over the rules of several regex transformers.
+
+    Each source rule becomes a named branch; the single replacer dispatches
+    on the branch that matched. Per-rule IGNORECASE flags are preserved with
+    inline (?i:...) groups so rules with different casing can share a scan.
+    """
+
+    def __init__(self, rules: List[Tuple[re.Pattern, Callable[[re.Match], str]]]):
+        self._dispatch: Dict[str, Callable[[re.Match], str]] = {}
+
+        branches = []
+        for index, (pattern, replacer) in enumerate(rules):
+            name = f"r{index}"
+            inner = pattern.pattern
+            if pattern.flags & re.IGNORECASE:
+                inner = f"(?i:{inner})"
+            branches.append(f"(?P<{name}>{inner})")
+            self._dispatch[name] = replacer
+
+        self._pattern = _compile_pattern('|'.join(branches))
+
+    def _substitute(self, match: re.Match) -> str:
+        """Route the match to the replacer of whichever branch fired."""
+        return self._dispatch[match.lastgroup](match)
+
+    def transform(self, text: str) -> str:
+        """Apply every fused rule in a single scan."""
+        return self._pattern.sub(self._substitute, text)
+
+
+_SENTENCE_END = _compile_pattern(r'[.!?\n]\s')
+
+
+def _split_safe_chunks(text: str, chunk_size: int) -> Iterator[str]:
+    """
+    Yield pieces of text no longer than roughly chunk_size.
+
+    Each cut lands just after the last sentence end inside the window,
+    falling back to the last whitespace and then to a hard cut, so word-
+    and sentence-level rules see complete units within each piece.
+    """
+    if len(text) <= chunk_size:
+        if text:
+            yield text
+        return
+
+    position = 0
+    length = len(text)
+    while position < length:
+        window_end = position + chunk_size
+        if window_end >= length:
+            yield text[position:]
+            return
+
+        cut = position
+        for match in _SENTENCE_END.finditer(text, position, window_end):
+            cut = match.end()
+        if cut == position:
+            cut = text.rfind(' ', position, window_end) + 1
+        if cut <= position:
+            cut = window_end
+        yield text[position:cut]
+        position = cut
+
+
 class TextFilter:
     """
     Main transformation engine that applies multiple transformers in sequence.
@@ -339,10 +905,12 @@ class TextFilter:
         self.transformers: List[Transformer] = []
         self.prefix: str = ""
         self.suffix: str = ""
+        self._stages: Optional[List[Transformer]] = None
 
     def add(self, transformer: Transformer):
         """Add a transformer to the pipeline."""
         self.transformers.append(transformer)
+        self._stages = None
 
     def set_prefix(self, prefix: str):
         """Add text before the output."""
@@ -352,12 +920,75 @@ class TextFilter:
         """Add text after the output."""
         self.suffix = suffix
 
+    def compile(self):
+        """
+        Fuse consecutive regex transformers into single-pass stages.
+
+        Runs of adjacent RegexTransformer stages are merged into one
+        alternation scanned once, instead of each stage re-scanning and
+        re-allocating the full string. Trade-off: fused stages match the
+        original input rather than each other's output, so only compile
+        pipelines whose stages are independent. Transformers whose rules
+        capture groups (suffix/prefix replacers) and non-regex stages are
+        left as their own passes.
+        """
+        stages: List[Transformer] = []
+        run: List[RegexTransformer] = []
+
+        def flush_run():
+            if not run:
+                return
+            if len(run) == 1:
+                stages.append(run[0])
+            else:
+                rules = [rule for transformer in run for rule in transformer.rules]
+                stages.append(_FusedRegexStage(rules))
+            run.clear()
+
+        for transformer in self.transformers:
+            fusable = (isinstance(transformer, RegexTransformer)
+                       and bool(transformer.rules)
+                       and all(pattern.groups == 0 for pattern, _ in transformer.rules))
+            if fusable:
+                run.append(transformer)
+            else:
+                flush_run()
+                stages.append(transformer)
+        flush_run()
+
+        self._stages = stages
+
     def transform(self, text: str) -> str:
-        """Apply all transformers in sequence."""
+        """Apply all transformers (fused stages, if compiled) in sequence."""
+        return ''.join((self.prefix, self._apply(text), self.suffix))
+
+    def transform_iter(self, text: str, chunk_size: int = 65536) -> Iterator[str]:
+        """
+        Apply the pipeline to text in pieces, yielding transformed chunks.
+
+        Long inputs are split at sentence ends (or whitespace, failing
+        that) near chunk_size and each piece runs through the full
+        pipeline, so peak memory stays proportional to the chunk rather
+        than the whole text. Rules never match across a chunk boundary;
+        the sentence-end splits keep that safe for word- and phrase-level
+        rules. Frequency-1 SentenceAugmenter rules cycle their additions
+        per call, so they restart at each chunk and streamed output can
+        differ from transform() when such a rule has several additions.
+        """
+        if self.prefix:
+            yield self.prefix
+        for chunk in _split_safe_chunks(text, chunk_size):
+            yield self._apply(chunk)
+        if self.suffix:
+            yield self.suffix
+
+    def _apply(self, text: str) -> str:
+        """Run text through the fused stages if compiled, else the raw list."""
         result = text
-        for transformer in self.transformers:
+        for transformer in (self._stages if self._stages is not None
+                            else self.transformers):
             result = transformer.transform(result)
-        return self.prefix + result + self.suffix
+        return result
 
 
 # ============================================================================
@@ -1,18 +1,29 @@
 import json
 import pathlib
 from typing import Dict, List, Optional
+import numpy as np
 import spacy
 from spacy.tokens import Token
 
+try:
+    import faiss
+except ImportError:
+    # Optional accelerator; the numpy matrix product below always works
+    faiss = None
+
 class SlangMapper:
     """
     Handles semantic mapping between 'Base English' and Subculture Slang
     using Cosine Similarity via spaCy word vectors.
     """
     def __init__(self, model_name: str = "en_core_web_md", threshold: float = 0.7):
-        self.nlp = spacy.load(model_name)
+        # POS tags and lemmas are all translation needs; the parser and NER
+        # are the slowest components and go unused
+        self.nlp = spacy.load(model_name, disable=["parser", "ner"])
         self.threshold = threshold
-        self.anchors: Dict[str, spacy.tokens.Span] = {}
+        self._anchor_words: List[str] = []
+        self._anchor_matrix: Optional[np.ndarray] = None
+        self._anchor_index = None
         self.slang_map: Dict[str, str] = {}
         self.augmentation: Dict = {}
 
@@ -20,40 +31,78 @@ class SlangMapper:
         """Loads a culture JSON and pre-vectorizes the keys for performance."""
         with open(file_path, 'r') as f:
             data = json.load(f)
-            
+
         subs = data.get("substitutions", {})
-        # Vectorize keys once (The 'Anchor' words)
-        self.anchors = {word: self.nlp(word) for word in subs.keys()}
+        # Vectorize keys once into one row-normalized matrix (the 'Anchors'),
+        # so similarity against all anchors is a single matrix-vector product
+        self._anchor_words = list(subs.keys())
+        if self._anchor_words:
+            vectors = np.stack([self._word_vector(word) for word in self._anchor_words])
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            norms[norms == 0.0] = 1.0
+            self._anchor_matrix = vectors / norms
+        else:
+            self._anchor_matrix = None
+        # With normalized rows, inner product equals cosine similarity, so a
+        # FAISS IndexFlatIP answers nearest-anchor queries when available
+        self._anchor_index = None
+        if faiss is not None and self._anchor_matrix is not None:
+            index = faiss.IndexFlatIP(self._anchor_matrix.shape[1])
+            index.add(self._anchor_matrix.astype(np.float32))
+            self._anchor_index = index
         self.slang_map = subs
         self.augmentation = data.get("sentence_augmentation", [])
 
+    def _word_vector(self, word: str) -> np.ndarray:
+        """O(1) vocab lookup for single words; tokenizer-only doc for phrases."""
+        if ' ' not in word:
+            return self.nlp.vocab[word].vector
+        return self.nlp.make_doc(word).vector
+
     def _get_best_slang(self, token: Token) -> str:
         """Finds the nearest semantic neighbor above the threshold."""
-        if not token.has_vector or not self.anchors:
+        if not token.has_vector or self._anchor_matrix is None:
             return token.text
 
         # Exact match check (O(1) optimization)
         if token.lemma_.lower() in self.slang_map:
             return self.slang_map[token.lemma_.lower()]
 
-        # Vector search
-        best_match = None
-        highest_sim = 0.0
+        # Vector search: one BLAS matrix-vector product against all anchors
+        vector = token.vector
+        norm = np.linalg.norm(vector)
+        if norm == 0.0:
+            return token.text
 
-        for base_word, vector in self.anchors.items():
-            sim = token.similarity(vector)
-            if sim > highest_sim:
-                highest_sim = sim
-                best_match = base_word
+        unit_vector = vector / norm
+        if self._anchor_index is not None:
+            scores, indices = self._anchor_index.search(
+                unit_vector.astype(np.float32).reshape(1, -1), 1
+            )
+            if float(scores[0, 0]) >= self.threshold:
+                return self.slang_map[self._anchor_words[int(indices[0, 0])]]
+            return token.text
 
-        if best_match and highest_sim >= self.threshold:
-            return self.slang_map[best_match]
+        similarities = self._anchor_matrix @ unit_vector
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.threshold:
+            return self.slang_map[self._anchor_words[best]]
 
         return token.text
 
     def translate_sentence(self, sentence: str) -> str:
         """Processes a sentence, protecting functional words and mapping content words."""
-        doc = self.nlp(sentence)
+        return self._translate_doc(self.nlp(sentence))
+
+    def translate_sentences(self, sentences: List[str]) -> List[str]:
+        """Batch variant of translate_sentence; nlp.pipe amortizes per-doc setup."""
+        return [
+            self._translate_doc(doc)
+            for doc in self.nlp.pipe(sentences, batch_size=64)
+        ]
+
+    def _translate_doc(self, doc: spacy.tokens.Doc) -> str:
+        """Maps one processed doc to slang, token by token."""
         result = []
 
         for token in doc:
@@ -10,13 +10,18 @@ License: GPL
 """
 
 import sys
+import threading
+import json
 from pathlib import Path
-from typing import Dict, List
-from flask import Flask, render_template, request, jsonify
+from typing import Dict, Iterator, List, Tuple
+from flask import Flask, Response, render_template, request, jsonify, stream_with_context
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src' / 'python'))
 
 from filter_factory import FilterFactory
+from text_transformer import TextFilter
+
+_DISCOVER_CACHE: Dict[Path, Tuple[int, List[Dict[str, str]]]] = {}
 
 
 class WebDemo:
@@ -31,19 +36,33 @@ class WebDemo:
         """
         self.filters_directory = filters_directory
         self.available_filters = self._discover_filters()
+        self._filter_cache: Dict[str, Tuple[int, TextFilter]] = {}
+        self._cache_lock = threading.Lock()
 
     def _discover_filters(self) -> List[Dict[str, str]]:
         """
         Discover all available filter JSON files.
 
+        The discovered list (including formatted names) is cached at
+        module level keyed on the directory's mtime, so repeated
+        constructions under the Flask reloader reuse it instead of
+        re-globbing and re-formatting.
+
         Returns:
             List of dicts with 'id' and 'name' for each filter
         """
+        mtime_ns = self.filters_directory.stat().st_mtime_ns
+        cached = _DISCOVER_CACHE.get(self.filters_directory)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
         filters = []
         for json_file in sorted(self.filters_directory.glob('*.json')):
             filter_id = json_file.stem
             filter_name = self._format_filter_name(filter_id)
             filters.append({'id': filter_id, 'name': filter_name})
+
+        _DISCOVER_CACHE[self.filters_directory] = (mtime_ns, filters)
         return filters
 
     @staticmethod
@@ -87,9 +106,54 @@ class WebDemo:
         if not filter_path.exists():
             raise FileNotFoundError(f'Filter {filter_id} not found')
 
-        text_filter = FilterFactory.from_json(str(filter_path))
+        text_filter = self._compiled_filter(filter_id, filter_path)
         return text_filter.transform(text)
 
+    def transform_text_iter(self, filter_id: str, text: str) -> Iterator[str]:
+        """
+        Apply a filter transformation, yielding transformed chunks.
+
+        Streaming variant of transform_text for very long inputs: the
+        filter processes the text piecewise via TextFilter.transform_iter,
+        so the whole transformed string is never held in memory at once.
+
+        Args:
+            filter_id: ID of the filter to apply
+            text: Input text to transform
+
+        Yields:
+            Transformed text chunks, in order
+
+        Raises:
+            FileNotFoundError: If filter does not exist
+            ValueError: If filter configuration is invalid
+        """
+        filter_path = self.filters_directory / f'{filter_id}.json'
+        if not filter_path.exists():
+            raise FileNotFoundError(f'Filter {filter_id} not found')
+
+        text_filter = self._compiled_filter(filter_id, filter_path)
+        return text_filter.transform_iter(text)
+
+    def _compiled_filter(self, filter_id: str, filter_path: Path) -> TextFilter:
+        """
+        Return the compiled filter for an ID, reusing a cached instance.
+
+        Compiled TextFilter objects are cached per filter and invalidated
+        when the JSON file's mtime changes, so requests pay only the
+        transform cost rather than a parse and regex compile each time.
+        """
+        mtime_ns = filter_path.stat().st_mtime_ns
+        with self._cache_lock:
+            cached = self._filter_cache.get(filter_id)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+
+        text_filter = FilterFactory.from_json(str(filter_path))
+        with self._cache_lock:
+            self._filter_cache[filter_id] = (mtime_ns, text_filter)
+        return text_filter
+
 
 app = Flask(__name__)
 demo = WebDemo(Path(__file__).parent.parent / 'src' / 'filters')
@@ -139,5 +203,47 @@ def transform():
         return jsonify({'error': f'Transformation failed: {str(e)}'}), 500
 
 
+@app.route('/transform/stream', methods=['POST'])
+def transform_stream():
+    """
+    Streaming API endpoint for transforming very long texts.
+
+    Takes the same JSON payload as /transform but responds with
+    newline-delimited JSON, one {"result_chunk": ...} object per
+    transformed chunk. Clients concatenate the chunks in order.
+
+    Returns:
+        NDJSON streaming response, or a JSON error
+    """
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({'error': 'No data provided'}), 400
+
+        filter_id = data.get('filter')
+        text = data.get('text', '')
+
+        if not filter_id:
+            return jsonify({'error': 'Filter not specified'}), 400
+
+        if not text:
+            return jsonify({'error': 'No text provided'}), 400
+
+        chunks = demo.transform_text_iter(filter_id, text)
+
+        def generate():
+            for chunk in chunks:
+                yield json.dumps({'result_chunk': chunk}) + '\n'
+
+        return Response(stream_with_context(generate()),
+                        mimetype='application/x-ndjson')
+
+    except FileNotFoundError as e:
+        return jsonify({'error': str(e)}), 404
+    except Exception as e:
+        return jsonify({'error': f'Transformation failed: {str(e)}'}), 500
+
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)